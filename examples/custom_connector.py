@@ -1,14 +1,15 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 import json
 from fluxr import Flux, Task, Connector
 
 class JSONFileConnector(Connector):
+    file_path: Optional[str] = None
+    
     def __init__(self, name: str = "JSONFileConnector"):
         super().__init__(
             name=name,
             description="Read and write JSON files"
         )
-        self.file_path = None
         
     async def initialize(self) -> None:
         """Initialize the JSON file connector."""
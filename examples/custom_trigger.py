@@ -3,13 +3,15 @@ from datetime import datetime
 from fluxr import Flux, Task, Trigger
 
 class TimeBasedTrigger(Trigger):
+    execution_time: datetime
+    
     def __init__(self, execution_time: datetime):
         super().__init__(
             name="TimeBasedTrigger",
             event_type="time",
-            description="Trigger task at specific time"
+            description="Trigger task at specific time",
+            execution_time=execution_time
         )
-        self.execution_time = execution_time
         self._active = False
         
     async def activate(self) -> None:
@@ -9,7 +9,7 @@ setup(
         "colorama>=0.4.6",
         "pydantic>=2.0.0",
         "loguru>=0.7.0",
-        "openai>=1.0.0",
+        "openai>=1.17.0",
         "python-telegram-bot>=20.0",
         "openpyxl>=3.1.0"
     ],
@@ -1,5 +1,7 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
+from loguru import logger
 from pydantic import BaseModel
 
 class FluxrComponent(BaseModel, ABC):
@@ -106,18 +108,41 @@ class Task(FluxrComponent):
         """Hook executed after task execution."""
         pass
     
+    async def _connect(self, connector: Connector, connected: List[Connector]) -> None:
+        """Initialize and connect a single connector, recording it once connected."""
+        await connector.initialize()
+        await connector.pre_connect()
+        await connector.connect()
+        connected.append(connector)
+        await connector.post_connect()
+    
+    async def _disconnect(self, connector: Connector) -> None:
+        """Disconnect a single connector."""
+        await connector.pre_disconnect()
+        await connector.disconnect()
+        await connector.post_disconnect()
+    
     async def execute(self) -> Any:
         """Execute the task workflow."""
         # Pre-execution hook
         await self.pre_execute()
         
+        connected: List[Connector] = []
+        succeeded = False
         try:
-            # Initialize and connect components
-            for connector in self.connectors:
-                await connector.initialize()
-                await connector.pre_connect()
-                await connector.connect()
-                await connector.post_connect()
+            # Initialize and connect components concurrently; wait for all
+            # of them to settle before surfacing the first failure
+            results = await asyncio.gather(
+                *(self._connect(connector, connected) for connector in self.connectors),
+                return_exceptions=True
+            )
+            errors = []
+            for connector, result in zip(self.connectors, results):
+                if isinstance(result, BaseException):
+                    logger.error("Failed to connect {}: {}", connector.name, result)
+                    errors.append(result)
+            if errors:
+                raise errors[0]
                 
             for tool in self.tools:
                 await tool.initialize()
@@ -132,11 +157,21 @@ class Task(FluxrComponent):
             # Post-execution hook
             await self.post_execute()
             
+            succeeded = True
             return result
             
         finally:
-            # Cleanup
-            for connector in self.connectors:
-                await connector.pre_disconnect()
-                await connector.disconnect()
-                await connector.post_disconnect()
\ No newline at end of file
+            # Cleanup only what actually connected; one failing disconnect
+            # must not skip the others
+            results = await asyncio.gather(
+                *(self._disconnect(connector) for connector in connected),
+                return_exceptions=True
+            )
+            errors = []
+            for connector, result in zip(connected, results):
+                if isinstance(result, BaseException):
+                    logger.error("Failed to disconnect {}: {}", connector.name, result)
+                    errors.append(result)
+            # Don't mask an error from the task body with a cleanup error
+            if errors and succeeded:
+                raise errors[0]
\ No newline at end of file
@@ -1,11 +1,13 @@
-from typing import Dict, Any
-import openpyxl
+from itertools import islice
+from typing import AsyncIterator, Dict, Any, Iterator, List
+from pydantic import PrivateAttr
 from ..base import Connector
 
 class ExcelConnector(Connector):
+    _workbook: Any = PrivateAttr(default=None)
+    
     def __init__(self, name: str = "ExcelConnector"):
         super().__init__(name=name)
-        self.workbook = None
         
     async def initialize(self) -> None:
         """Initialize the Excel connector."""
@@ -16,26 +18,43 @@ class ExcelConnector(Connector):
         file_path = self.connection_params.get("file_path")
         if not file_path:
             raise ValueError("Excel file path not provided")
-        self.workbook = openpyxl.load_workbook(file_path)
+        import openpyxl
+        self._workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
         
     async def disconnect(self) -> None:
         """Close Excel file."""
-        if self.workbook:
-            self.workbook.close()
+        if self._workbook:
+            # Read-only workbooks keep the archive open until closed
+            self._workbook.close()
+            self._workbook = None
             
-    async def read_worksheet(self, sheet_name: str) -> List[Dict[str, Any]]:
-        """Read data from worksheet."""
-        if not self.workbook:
+    def _iter_rows(self, sheet_name: str) -> Iterator[Dict[str, Any]]:
+        """Yield worksheet rows as dicts keyed by the header row."""
+        if not self._workbook:
             raise RuntimeError("Not connected to Excel file")
             
-        worksheet = self.workbook[sheet_name]
-        headers = [cell.value for cell in worksheet[1]]
-        
-        data = []
-        for row in worksheet.iter_rows(min_row=2):
-            row_data = {}
-            for header, cell in zip(headers, row):
-                row_data[header] = cell.value
-            data.append(row_data)
+        # Stream plain value tuples instead of building Cell objects
+        rows = self._workbook[sheet_name].values
+        headers = next(rows, None)
+        if headers is None:
+            return
+            
+        for row in rows:
+            yield dict(zip(headers, row))
             
-        return data
\ No newline at end of file
+    async def read_worksheet(self, sheet_name: str) -> List[Dict[str, Any]]:
+        """Read data from worksheet."""
+        return list(self._iter_rows(sheet_name))
+        
+    async def iter_worksheet(
+        self,
+        sheet_name: str,
+        chunk_size: int = 1000
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield worksheet rows in chunks without loading the whole sheet."""
+        rows = self._iter_rows(sheet_name)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield chunk
\ No newline at end of file
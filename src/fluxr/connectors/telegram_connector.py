@@ -1,32 +1,129 @@
-from typing import Optional
-from telegram.ext import ApplicationBuilder
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import PrivateAttr
 from ..base import Connector
 
+# Telegram rejects messages longer than this many characters
+MAX_MESSAGE_LENGTH = 4096
+
+class _RateLimiter:
+    """Space out calls so that at most `rate` of them start per second."""
+    
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+        
+    async def wait(self) -> None:
+        """Wait for the next free send slot."""
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
 class TelegramConnector(Connector):
+    _app: Any = PrivateAttr(default=None)
+    _app_settings: Optional[Tuple[str, Optional[int]]] = PrivateAttr(default=None)
+    _limiter: Optional[_RateLimiter] = PrivateAttr(default=None)
+    _chat_limiters: Dict[int, _RateLimiter] = PrivateAttr(default_factory=dict)
+    _chat_rate: float = PrivateAttr(default=1.0)
+    _max_concurrent_sends: int = PrivateAttr(default=30)
+    
     def __init__(self, name: str = "TelegramConnector"):
         super().__init__(name=name)
-        self.app = None
         
     async def initialize(self) -> None:
         """Initialize the Telegram connector."""
         token = self.connection_params.get("token")
         if not token:
             raise ValueError("Telegram bot token not provided")
-        self.app = ApplicationBuilder().token(token).build()
+        # Stay under Telegram's limits of ~30 messages per second overall
+        # and ~1 message per second in a single chat
+        rate = self.connection_params.get("messages_per_second", 30)
+        chat_rate = self.connection_params.get("messages_per_chat_per_second", 1)
+        max_concurrent_sends = self.connection_params.get("max_concurrent_sends", 30)
+        if rate <= 0 or chat_rate <= 0 or max_concurrent_sends <= 0:
+            raise ValueError("Telegram rate limits must be positive")
+        self._limiter = _RateLimiter(rate)
+        self._chat_rate = chat_rate
+        self._max_concurrent_sends = max_concurrent_sends
+        self._chat_limiters = {}
+        # Build the application only when its settings change; the HTTP
+        # pool itself is closed by disconnect() and reopened by connect()
+        pool_size = self.connection_params.get("connection_pool_size")
+        settings = (token, pool_size)
+        if self._app and self._app_settings == settings:
+            return
+        from telegram.ext import ApplicationBuilder
+        builder = ApplicationBuilder().token(token)
+        if pool_size:
+            builder = builder.connection_pool_size(pool_size)
+        self._app = builder.build()
+        self._app_settings = settings
         
     async def connect(self) -> None:
         """Start Telegram bot."""
-        if not self.app:
+        if not self._app:
             raise RuntimeError("Telegram bot not initialized")
-        await self.app.initialize()
+        await self._app.initialize()
         
     async def disconnect(self) -> None:
         """Stop Telegram bot."""
-        if self.app:
-            await self.app.shutdown()
+        if self._app:
+            await self._app.shutdown()
             
     async def send_message(self, chat_id: int, text: str) -> None:
         """Send message to Telegram chat."""
-        if not self.app:
+        if not self._app:
             raise RuntimeError("Telegram bot not connected")
-        await self.app.bot.send_message(chat_id=chat_id, text=text)
\ No newline at end of file
+        chat_limiter = self._chat_limiters.get(chat_id)
+        if chat_limiter is None:
+            chat_limiter = self._chat_limiters[chat_id] = _RateLimiter(self._chat_rate)
+        # Wait for the chat first so a global slot isn't held while waiting
+        await chat_limiter.wait()
+        await self._limiter.wait()
+        await self._app.bot.send_message(chat_id=chat_id, text=text)
+        
+    async def send_messages(self, chat_id: int, texts: List[str]) -> None:
+        """Send several texts to a Telegram chat in as few messages as possible."""
+        # Sent one by one so the chat receives them in order
+        for message in self._pack_messages(texts):
+            await self.send_message(chat_id, message)
+            
+    async def broadcast_message(self, chat_ids: List[int], text: str) -> Dict[int, BaseException]:
+        """Send a message to several Telegram chats concurrently; return failures by chat."""
+        semaphore = asyncio.Semaphore(self._max_concurrent_sends)
+        
+        async def send(chat_id: int) -> None:
+            async with semaphore:
+                await self.send_message(chat_id, text)
+                
+        results = await asyncio.gather(
+            *(send(chat_id) for chat_id in chat_ids),
+            return_exceptions=True
+        )
+        return {
+            chat_id: result
+            for chat_id, result in zip(chat_ids, results)
+            if isinstance(result, BaseException)
+        }
+            
+    @staticmethod
+    def _pack_messages(texts: List[str]) -> List[str]:
+        """Join texts line by line into messages that fit Telegram's length limit."""
+        messages = []
+        parts: List[str] = []
+        length = 0
+        for text in texts:
+            # Texts that are too long on their own are split across messages
+            for start in range(0, len(text), MAX_MESSAGE_LENGTH):
+                piece = text[start:start + MAX_MESSAGE_LENGTH]
+                if parts and length + 1 + len(piece) > MAX_MESSAGE_LENGTH:
+                    messages.append("\n".join(parts))
+                    parts, length = [], 0
+                length += len(piece) + (1 if parts else 0)
+                parts.append(piece)
+        if parts:
+            messages.append("\n".join(parts))
+        return messages
\ No newline at end of file
@@ -1,5 +1,6 @@
 import asyncio
-from typing import List, Literal
+import sys
+from typing import List, Literal, Optional
 import logging
 from loguru import logger
 from colorama import init, Fore
@@ -7,6 +8,29 @@ from .base import Task
 
 TriggerMode = Literal["manual", "auto"]
 
+_file_sink_id: Optional[int] = None
+
+def _add_file_sink() -> None:
+    """Install the fluxr.log sink, replacing the one a previous Flux added.
+    
+    The file is only created on the first record.
+    """
+    global _file_sink_id
+    if _file_sink_id is not None:
+        try:
+            logger.remove(_file_sink_id)
+        except ValueError:
+            # Already removed by the application, e.g. via logger.remove()
+            pass
+    _file_sink_id = logger.add(
+        "fluxr.log",
+        rotation="1 day",
+        retention="7 days",
+        level="DEBUG",
+        format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
+        delay=True
+    )
+
 class Flux:
     def __init__(
         self,
@@ -19,41 +43,44 @@ class Flux:
         self.trigger_mode = trigger_mode
         self.tasks: List[Task] = []
         
-        # Initialize colorama for cross-platform colored output
-        init()
+        # Initialize colorama for cross-platform colored output, but only
+        # emit ANSI colors when writing to a terminal
+        self._color = sys.stdout.isatty()
+        if self._color:
+            init()
         
         # Configure logging
         if log:
-            logger.add(
-                "fluxr.log",
-                rotation="1 day",
-                retention="7 days",
-                level="DEBUG",
-                format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}"
-            )
+            _add_file_sink()
+    
+    def _echo(self, color: str, message: str) -> None:
+        """Print a verbose message, colored when stdout is a terminal."""
+        if self._color:
+            message = f"{color}{message}{Fore.RESET}"
+        print(message)
     
     def add_task(self, task: Task) -> None:
         """Add a task to the workflow."""
         self.tasks.append(task)
         if self.verbose:
-            print(f"{Fore.GREEN}Added task: {task.name}{Fore.RESET}")
+            self._echo(Fore.GREEN, f"Added task: {task.name}")
         if self.log:
-            logger.debug(f"Task added: {task.name}")
+            logger.debug("Task added: {}", task.name)
     
     async def _execute_tasks(self) -> None:
         """Execute all tasks in sequence."""
         for task in self.tasks:
             if self.verbose:
-                print(f"{Fore.YELLOW}Executing task: {task.name}{Fore.RESET}")
+                self._echo(Fore.YELLOW, f"Executing task: {task.name}")
             if self.log:
-                logger.info(f"Starting task execution: {task.name}")
+                logger.info("Starting task execution: {}", task.name)
                 
             try:
                 # Activate triggers if in auto mode
                 if self.trigger_mode == "auto":
                     for trigger in task.triggers:
                         if self.verbose:
-                            print(f"{Fore.CYAN}Activating trigger: {trigger.name}{Fore.RESET}")
+                            self._echo(Fore.CYAN, f"Activating trigger: {trigger.name}")
                         await trigger.activate()
                 
                 result = await task.execute()
@@ -64,32 +91,32 @@ class Flux:
                         await trigger.deactivate()
                 
                 if self.verbose:
-                    print(f"{Fore.GREEN}Task completed: {task.name}{Fore.RESET}")
+                    self._echo(Fore.GREEN, f"Task completed: {task.name}")
                 if self.log:
-                    logger.success(f"Task completed: {task.name}")
+                    logger.success("Task completed: {}", task.name)
             except Exception as e:
                 if self.verbose:
-                    print(f"{Fore.RED}Task failed: {task.name} - {str(e)}{Fore.RESET}")
+                    self._echo(Fore.RED, f"Task failed: {task.name} - {str(e)}")
                 if self.log:
-                    logger.error(f"Task failed: {task.name} - {str(e)}")
+                    logger.error("Task failed: {} - {}", task.name, e)
                 raise
     
     def run(self) -> None:
         """Run the workflow."""
         if self.verbose:
-            print(f"{Fore.CYAN}Starting Fluxr workflow in {self.trigger_mode} mode{Fore.RESET}")
+            self._echo(Fore.CYAN, f"Starting Fluxr workflow in {self.trigger_mode} mode")
         if self.log:
-            logger.info(f"Starting Fluxr workflow in {self.trigger_mode} mode")
+            logger.info("Starting Fluxr workflow in {} mode", self.trigger_mode)
             
         try:
             asyncio.run(self._execute_tasks())
             if self.verbose:
-                print(f"{Fore.CYAN}Workflow completed successfully{Fore.RESET}")
+                self._echo(Fore.CYAN, "Workflow completed successfully")
             if self.log:
                 logger.success("Workflow completed successfully")
         except Exception as e:
             if self.verbose:
-                print(f"{Fore.RED}Workflow failed: {str(e)}{Fore.RESET}")
+                self._echo(Fore.RED, f"Workflow failed: {str(e)}")
             if self.log:
-                logger.error(f"Workflow failed: {str(e)}")
+                logger.error("Workflow failed: {}", e)
             raise
\ No newline at end of file
@@ -1,38 +1,95 @@
-from typing import Any, Optional
-import openai
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from pydantic import PrivateAttr
 from ..base import Tool
 
 class AgentTool(Tool):
+    model: str = "gpt-3.5-turbo"
+    purpose: str = "general"
+    cache_enabled: bool = True
+    cache_size: int = 1024
+    _client: Any = PrivateAttr(default=None)
+    _loop: Optional[asyncio.AbstractEventLoop] = PrivateAttr(default=None)
+    _system_message: Optional[Dict[str, str]] = PrivateAttr(default=None)
+    _cache: "OrderedDict[Tuple[str, str, str], str]" = PrivateAttr(default_factory=OrderedDict)
+    
     def __init__(
         self,
         name: str = "AgentTool",
         model: str = "gpt-3.5-turbo",
-        purpose: str = "general"
+        purpose: str = "general",
+        cache_enabled: bool = True,
+        cache_size: int = 1024
     ):
-        super().__init__(name=name)
-        self.model = model
-        self.purpose = purpose
+        super().__init__(
+            name=name,
+            model=model,
+            purpose=purpose,
+            cache_enabled=cache_enabled,
+            cache_size=cache_size
+        )
         
     async def initialize(self) -> None:
         """Initialize the AI agent."""
         api_key = self.config.get("openai_api_key")
         if not api_key:
             raise ValueError("OpenAI API key not provided")
-        openai.api_key = api_key
+        # Reuse one client (and its connection pool) across executions, but
+        # only on the loop that owns its connections: Flux.run starts a new
+        # event loop on every call
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.api_key != api_key or self._loop is not loop:
+            # A client from a finished loop can't be closed from this one;
+            # it is dropped unclosed and its sockets are left to the GC
+            if self._client is not None and self._loop is loop:
+                await self._client.close()
+            import openai
+            # Own the HTTP client: the SDK's default one schedules its own
+            # close on whatever loop is running when it is garbage collected
+            self._client = openai.AsyncOpenAI(
+                api_key=api_key,
+                http_client=openai.DefaultAsyncHttpxClient()
+            )
+            self._loop = loop
+            
+        # Prepare system message based on purpose once per run
+        self._system_message = {
+            "role": "system",
+            "content": f"You are an AI assistant specialized in {self.purpose}."
+        }
         
     async def execute(self, input_data: Any) -> str:
         """Execute AI agent task."""
         if not input_data:
             raise ValueError("No input data provided")
+        if not self._client:
+            raise RuntimeError("AI agent not initialized")
+            
+        if not isinstance(input_data, str):
+            input_data = str(input_data)
+        if not self.cache_enabled:
+            return await self._complete(input_data)
+            
+        # Identical prompts are answered from the LRU cache
+        key = (self.model, self.purpose, input_data)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
             
-        # Prepare system message based on purpose
-        system_message = f"You are an AI assistant specialized in {self.purpose}."
+        result = await self._complete(input_data)
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
         
-        response = await openai.ChatCompletion.create(
+    async def _complete(self, prompt: str) -> str:
+        """Send a prompt to the chat completions API."""
+        response = await self._client.chat.completions.create(
             model=self.model,
             messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": str(input_data)}
+                self._system_message,
+                {"role": "user", "content": prompt}
             ]
         )
         
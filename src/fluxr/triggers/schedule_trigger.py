@@ -1,27 +1,96 @@
+import asyncio
 from datetime import datetime, timedelta
-from typing import Optional, Callable, Awaitable
+from typing import Optional, Callable, Awaitable, Set
+from loguru import logger
+from pydantic import Field, PrivateAttr
 from ..base import Trigger
 
 class ScheduleTrigger(Trigger):
+    interval: timedelta = timedelta(minutes=5)
+    callback: Optional[Callable[[], Awaitable[None]]] = None
+    overlap: bool = False
+    max_concurrency: int = Field(default=10, ge=1)
+    _active: bool = PrivateAttr(default=False)
+    _semaphore: Optional[asyncio.Semaphore] = PrivateAttr(default=None)
+    _in_flight: Set[asyncio.Task] = PrivateAttr(default_factory=set)
+    _error: Optional[BaseException] = PrivateAttr(default=None)
+    
     def __init__(
         self,
         name: str = "ScheduleTrigger",
         interval: timedelta = timedelta(minutes=5),
-        callback: Optional[Callable[[], Awaitable[None]]] = None
+        callback: Optional[Callable[[], Awaitable[None]]] = None,
+        overlap: bool = False,
+        max_concurrency: int = 10
     ):
-        super().__init__(name=name, event_type="schedule")
-        self.interval = interval
-        self.callback = callback
-        self._active = False
+        super().__init__(
+            name=name,
+            event_type="schedule",
+            interval=interval,
+            callback=callback,
+            overlap=overlap,
+            max_concurrency=max_concurrency
+        )
+        
+    async def initialize(self) -> None:
+        """Initialize the schedule trigger."""
+        pass
+        
+    async def _fire(self) -> None:
+        """Run one callback while holding a concurrency slot."""
+        async with self._semaphore:
+            await self.callback()
+            
+    def _on_fired(self, task: asyncio.Task) -> None:
+        """Collect the outcome of an overlapping callback."""
+        self._in_flight.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.error("Scheduled callback of {} failed: {}", self.name, error)
+            if self._error is None:
+                self._error = error
         
     async def activate(self) -> None:
         """Activate the schedule trigger."""
         self._active = True
+        loop = asyncio.get_running_loop()
+        period = self.interval.total_seconds()
+        if self.overlap:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._error = None
+        
+        # Fire on fixed deadlines so callback duration doesn't cause drift
+        deadline = loop.time()
         while self._active:
+            # Surface failed overlapping callbacks like awaited ones
+            if self._error is not None:
+                # Don't leave the other callbacks running without an owner
+                self._active = False
+                for task in self._in_flight:
+                    task.cancel()
+                await asyncio.gather(*self._in_flight, return_exceptions=True)
+                raise self._error
             if self.callback:
-                await self.callback()
-            await asyncio.sleep(self.interval.total_seconds())
+                if self.overlap:
+                    # Don't let a slow callback hold up the next tick, but skip
+                    # the tick when every slot is busy so runs can't pile up
+                    if not self._semaphore.locked():
+                        task = asyncio.create_task(self._fire())
+                        self._in_flight.add(task)
+                        task.add_done_callback(self._on_fired)
+                else:
+                    await self.callback()
+            deadline += period
+            # Skip ticks missed by a callback that overran the interval
+            while period > 0 and deadline < loop.time():
+                deadline += period
+            await asyncio.sleep(deadline - loop.time())
             
     async def deactivate(self) -> None:
         """Deactivate the schedule trigger."""
-        self._active = False
\ No newline at end of file
+        self._active = False
+        # Wait for overlapping callbacks that are still running
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
\ No newline at end of file